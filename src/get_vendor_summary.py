@@ -50,16 +50,42 @@ Raw Tables → SQL Aggregation → Data Cleaning → Feature Engineering → Sum
 
 import os
 import logging
+import logging.handlers
+import numpy as np
 import pandas as pd
+import pyarrow as pa
 from sqlalchemy import create_engine, text
 
+# Optional JIT compiler for the fused metric kernel (NumPy fallback otherwise)
+try:
+    import numba
+except ImportError:
+    numba = None
+
+# Row count from which the numba kernel beats NumPy; below it the JIT compile
+# (or cache load) costs more than the fused pass saves, e.g. on the ~10k-row summary
+NUMBA_MIN_ROWS = 1_000_000
+
+# Optional Arrow-native reader for summary fetches (psycopg2 + pandas otherwise)
+try:
+    import connectorx
+except ImportError:
+    connectorx = None
+
 # ==================== LOGGING SETUP ====================
 os.makedirs("logs", exist_ok=True)
+# One logger call feeds both the log file (buffered) and the console
+_file_handler = logging.FileHandler("logs/get_vendor_summary.log", mode="a", encoding="utf-8")
+_file_handler.setFormatter(logging.Formatter("%(asctime)s - %(levelname)s - %(message)s"))
+_console_handler = logging.StreamHandler()
+_console_handler.setLevel(logging.INFO)
+_console_handler.setFormatter(logging.Formatter("%(message)s"))
 logging.basicConfig(
-    filename="logs/get_vendor_summary.log",
     level=logging.DEBUG,
-    format="%(asctime)s - %(levelname)s - %(message)s",
-    filemode="a",
+    handlers=[
+        logging.handlers.MemoryHandler(capacity=1024, flushLevel=logging.ERROR, target=_file_handler),
+        _console_handler,
+    ],
 )
 
 # ==================== DATABASE CONFIGURATION ====================
@@ -71,9 +97,16 @@ DB_PORT = "5433"
 DB_NAME = "vendor_db"
 
 # Create database engine with connection pooling
+# pool_pre_ping replaces connections dropped by a server restart;
+# pool_recycle additionally retires connections older than an hour
+# INSERT executemany() is batched into 10k-row multi-row INSERT pages (insertmanyvalues)
 engine = create_engine(
     f"postgresql+psycopg2://{DB_USER}:{DB_PASS}@{DB_HOST}:{DB_PORT}/{DB_NAME}",
     pool_pre_ping=True,  # Verify connections before use
+    pool_recycle=3600,  # Refresh connections hourly
+    executemany_mode="values_plus_batch",
+    insertmanyvalues_page_size=10_000,
+    executemany_batch_page_size=10_000,
 )
 
 # ==================== DATA INGESTION HELPER ====================
@@ -89,17 +122,16 @@ except Exception:
     def ingest_db(df: pd.DataFrame, table_name: str, eng):
         """
         Fallback data writer - replaces table on each run
-        Uses batch processing for large datasets
+        Uses batch processing for large datasets (10k-row INSERT pages)
         """
         df.to_sql(
             table_name, 
             con=eng, 
             if_exists="replace", 
             index=False, 
-            method="multi", 
             chunksize=50_000
         )
-        logging.info(f"✅ Wrote {len(df):,} rows to '{table_name}' (replace)")
+        logging.info(f"[OK] Wrote {len(df):,} rows to '{table_name}' (replace)")
 
 # ==================== CORE BUSINESS LOGIC - SQL QUERY ====================
 VENDOR_SUMMARY_SQL = """
@@ -117,10 +149,35 @@ WITH freight_summary AS (
     GROUP BY vendornumber
 ),
 
+price_lookup AS MATERIALIZED (
+    -- Compact one-row-per-brand price lookup from purchase_prices
+    -- Keeps the hash-join build side small (cache-resident) instead of hashing purchases
+    SELECT
+        "brand",
+        MAX("price") AS price,
+        MAX("volume") AS volume
+    FROM purchase_prices
+    GROUP BY "brand"
+),
+
+valid_purchases AS (
+    -- Filter for positive purchase prices to include only valid transactions
+    -- Applied before the join so only needed rows/columns reach the GROUP BY
+    SELECT
+        "vendornumber",
+        "vendorname",
+        "brand",
+        "description",
+        "purchaseprice",
+        "quantity",
+        "dollars"
+    FROM purchases
+    WHERE "purchaseprice" > 0  -- Business rule: only valid purchases
+),
+
 purchase_summary AS (
     -- Aggregate purchase data with pricing information from purchases and purchase_prices
     -- Combines vendor purchase transactions with actual product pricing
-    -- Filter for positive purchase prices to include only valid transactions
     SELECT
         p."vendornumber",
         p."vendorname",
@@ -131,10 +188,9 @@ purchase_summary AS (
         pp."volume",
         SUM(p."quantity") AS total_purchase_quantity,
         SUM(p."dollars") AS total_purchase_dollars
-    FROM purchases p
-    JOIN purchase_prices pp
+    FROM valid_purchases p
+    JOIN price_lookup pp
         ON p."brand" = pp."brand"
-    WHERE p."purchaseprice" > 0  -- Business rule: only valid purchases
     GROUP BY p."vendornumber", p."vendorname", p."brand", p."description",
              p."purchaseprice", pp."price", pp."volume"
 ),
@@ -179,34 +235,233 @@ LEFT JOIN freight_summary fs
 ORDER BY ps.total_purchase_dollars DESC  -- Prioritize high-volume vendors
 """
 
+# ==================== SERVER-SIDE CLEANING & FEATURE ENGINEERING ====================
+VENDOR_SUMMARY_SQL_WITH_METRICS = f"""
+-- VENDOR PERFORMANCE SUMMARY WITH DERIVED METRICS
+-- Applies the clean_data() rules inside PostgreSQL so the result set is final as fetched
+-- Metrics are computed during the query instead of in a second pandas pass
+
+WITH vendor_summary AS (
+{VENDOR_SUMMARY_SQL}
+),
+
+filled_summary AS (
+    -- Data cleaning: numeric volume, nulls → 0 (text nulls → '0', as fillna(0) + astype(str)), trimmed text
+    SELECT
+        vendornumber,
+        COALESCE(TRIM(vendorname), '0') AS vendorname,
+        brand,
+        COALESCE(TRIM(description), '0') AS description,
+        COALESCE(purchaseprice, 0) AS purchaseprice,
+        COALESCE(actual_price, 0) AS actual_price,
+        COALESCE(
+            CASE WHEN TRIM(volume::text) ~ '^[+-]?([0-9]+[.]?[0-9]*|[.][0-9]+)([eE][+-]?[0-9]+)?$'
+                 THEN TRIM(volume::text)::double precision
+            END, 0
+        ) AS volume,  -- Same numbers pd.to_numeric accepts ('.5', '750.', '1e3', '-1'); others → 0
+        COALESCE(total_purchase_quantity, 0) AS total_purchase_quantity,
+        COALESCE(total_purchase_dollars, 0) AS total_purchase_dollars,
+        COALESCE(total_sales_quantity, 0) AS total_sales_quantity,
+        COALESCE(total_sales_dollars, 0) AS total_sales_dollars,
+        COALESCE(total_sales_price, 0) AS total_sales_price,
+        COALESCE(total_excise_tax, 0) AS total_excise_tax,
+        COALESCE(freight_cost, 0) AS freight_cost
+    FROM vendor_summary
+),
+
+profit_summary AS (
+    -- Gross profit computed once and shared by the metrics below
+    SELECT
+        *,
+        total_sales_dollars - total_purchase_dollars AS gross_profit
+    FROM filled_summary
+)
+
+-- Feature engineering: division by zero guarded with CASE, matching clean_data()
+SELECT
+    *,
+    CASE WHEN total_sales_dollars <> 0
+         THEN gross_profit::double precision / total_sales_dollars * 100
+         ELSE 0
+    END AS profit_margin,
+    CASE WHEN total_purchase_quantity <> 0
+         THEN total_sales_quantity::double precision / total_purchase_quantity
+         ELSE 0
+    END AS stock_turnover,
+    CASE WHEN total_purchase_dollars <> 0
+         THEN total_sales_dollars::double precision / total_purchase_dollars
+         ELSE 0
+    END AS sales_to_purchase_ratio
+FROM profit_summary
+ORDER BY total_purchase_dollars DESC
+"""
+
 # ==================== CORE FUNCTIONS ====================
 
-def create_vendor_summary(engine):
+def create_vendor_summary(engine, query: str = VENDOR_SUMMARY_SQL_WITH_METRICS):
     """
     Execute the main SQL query to create vendor summary dataset.
     
     PERFORMANCE NOTE:
     This query performs heavy joins and aggregations across multiple large tables.
     By pre-computing this summary, we avoid expensive repeated computations during analysis.
+    The default query also cleans the data and derives the business metrics server-side,
+    so the rows arrive final and need no pandas post-processing.
+    
+    With connectorx installed, the result is fetched in a single stream straight into
+    Arrow buffers; NUMERIC (decimal) columns are cast to float64 so both paths return
+    the same dtypes as read_sql_query's coerce_float.
+    Otherwise rows are fetched through a server-side cursor in 50k-row batches,
+    so psycopg2 never buffers the whole result set client-side at once.
+    
+    PARAMETERS:
+        query: VENDOR_SUMMARY_SQL_WITH_METRICS (default) or the raw VENDOR_SUMMARY_SQL
     
     RETURNS:
-        pandas.DataFrame: Raw vendor summary data from database
+        pandas.DataFrame: Vendor summary data from database
     """
-    logging.info("Running vendor summary CTE - combining purchases, sales, pricing, and freight data…")
-    df = pd.read_sql_query(text(VENDOR_SUMMARY_SQL), con=engine)
+    logging.info("Running vendor summary CTE - combining purchases, sales, pricing, and freight data...")
+    if connectorx is not None:
+        # Unpartitioned: a vendornumber range filter cannot prune the CTE's sales
+        # and price aggregates, so each partition would re-scan the raw tables
+        conn_url = engine.url.set(drivername="postgresql").render_as_string(hide_password=False)
+        table = connectorx.read_sql(conn_url, query, return_type="arrow")
+        # Decimal columns would otherwise become object columns of Decimal
+        float_schema = pa.schema([
+            field.with_type(pa.float64()) if pa.types.is_decimal(field.type) else field
+            for field in table.schema
+        ])
+        df = table.cast(float_schema).to_pandas()
+    else:
+        with engine.connect() as cx:
+            stream = cx.execution_options(stream_results=True, max_row_buffer=50_000)
+            chunks = pd.read_sql_query(text(query), con=stream, chunksize=50_000)
+            df = pd.concat(chunks, ignore_index=True)
     logging.info(f"Summary CTE returned {len(df):,} vendor-brand combinations")
     return df
 
 
+# ==================== METRIC KERNELS ====================
+if numba is not None:
+    @numba.njit(parallel=True, fastmath=True, cache=True)
+    def _metrics_kernel(sd, pd_, sq, pq, out_gp, out_pm, out_st, out_spr):
+        """
+        Compute all four derived metrics in a single fused pass over the rows.
+        
+        sd/pd_: total sales/purchase dollars, sq/pq: total sales/purchase quantity.
+        Zero denominators yield 0, matching the SQL CASE guards.
+        """
+        for i in numba.prange(len(sd)):
+            # Gross Profit: Total sales revenue minus total purchase cost
+            gp = sd[i] - pd_[i]
+            out_gp[i] = gp
+            # Profit Margin: Gross profit as percentage of sales revenue
+            out_pm[i] = 0.0 if sd[i] == 0.0 else gp / sd[i] * 100.0
+            # Stock Turnover: Sales quantity relative to purchase quantity
+            out_st[i] = 0.0 if pq[i] == 0.0 else sq[i] / pq[i]
+            # Sales-to-Purchase Ratio: Sales dollars relative to purchase dollars
+            out_spr[i] = 0.0 if pd_[i] == 0.0 else sd[i] / pd_[i]
+
+
+def _derive_metrics_numba(df: pd.DataFrame):
+    """
+    Add the four derived metric columns to df in place using the compiled kernel.
+    
+    One memory pass over contiguous float64 arrays instead of one pass per metric.
+    """
+    n = len(df)
+    out_gp, out_pm, out_st, out_spr = (np.empty(n, dtype=np.float64) for _ in range(4))
+    _metrics_kernel(
+        df["total_sales_dollars"].to_numpy(dtype=np.float64),
+        df["total_purchase_dollars"].to_numpy(dtype=np.float64),
+        df["total_sales_quantity"].to_numpy(dtype=np.float64),
+        df["total_purchase_quantity"].to_numpy(dtype=np.float64),
+        out_gp, out_pm, out_st, out_spr,
+    )
+    df["gross_profit"] = out_gp
+    df["profit_margin"] = out_pm
+    df["stock_turnover"] = out_st
+    df["sales_to_purchase_ratio"] = out_spr
+
+
+def _guarded_divide(num: np.ndarray, den: np.ndarray, scale: float = 1.0) -> np.ndarray:
+    """
+    Element-wise num / den * scale, with 0 wherever den == 0.
+    
+    np.divide writes only where the mask is true into a zero-filled output, so
+    no NaN/inf is produced and no separate .where() select pass is needed.
+    """
+    out = np.zeros(len(num), dtype=np.float64)
+    np.divide(num, den, out=out, where=den != 0)
+    if scale != 1.0:
+        out *= scale
+    return out
+
+
+def _derive_metrics_numpy(df: pd.DataFrame):
+    """
+    Add the four derived metric columns to df in place using NumPy.
+    
+    Used by clean_data() when numba is not installed or the frame has fewer
+    than NUMBA_MIN_ROWS rows.
+    """
+    sales_dollars = df["total_sales_dollars"].to_numpy(dtype=np.float64)
+    purchase_dollars = df["total_purchase_dollars"].to_numpy(dtype=np.float64)
+
+    # Gross Profit: Total sales revenue minus total purchase cost
+    # Fundamental measure of business profitability
+    gross_profit = sales_dollars - purchase_dollars
+    df["gross_profit"] = gross_profit
+
+    # Profit Margin: Gross profit as percentage of sales revenue
+    # Division by zero protection for records with no sales
+    # Key metric for comparing vendor profitability efficiency
+    df["profit_margin"] = _guarded_divide(gross_profit, sales_dollars, 100.0)
+
+    # Stock Turnover: Sales quantity relative to purchase quantity
+    # Measures inventory management efficiency
+    # High turnover indicates good inventory management
+    df["stock_turnover"] = _guarded_divide(
+        df["total_sales_quantity"].to_numpy(dtype=np.float64),
+        df["total_purchase_quantity"].to_numpy(dtype=np.float64),
+    )
+
+    # Sales-to-Purchase Ratio: Sales dollars relative to purchase dollars
+    # Indicates sales performance and pricing strategy
+    # Values > 1 indicate profitable sales operations
+    df["sales_to_purchase_ratio"] = _guarded_divide(sales_dollars, purchase_dollars)
+
+
+def _downcast_numeric(df: pd.DataFrame):
+    """
+    Shrink numeric columns in place to the narrowest safe dtype.
+    
+    - Quantity columns → smallest integer type holding their values
+    - Ratio metrics → float32 (dimensionless, no cents to preserve)
+    - Dollar amounts stay float64 to keep cent precision on large totals
+    """
+    for col in ("total_purchase_quantity", "total_sales_quantity"):
+        if col in df.columns:
+            df[col] = pd.to_numeric(df[col], downcast="integer")
+    for col in ("profit_margin", "stock_turnover", "sales_to_purchase_ratio"):
+        if col in df.columns:
+            df[col] = df[col].astype(np.float32)
+
+
 def clean_data(df: pd.DataFrame) -> pd.DataFrame:
     """
     Comprehensive data cleaning and feature engineering for vendor performance analysis.
     
+    Pandas equivalent of VENDOR_SUMMARY_SQL_WITH_METRICS, for frames fetched with the
+    raw VENDOR_SUMMARY_SQL (e.g. during notebook analysis). The pipeline itself
+    computes these metrics in the database.
+    
     CLEANING STEPS:
     1. Data type standardization for consistent analysis
     2. Null value handling to ensure data completeness
     3. Text data normalization for accurate grouping and filtering
     4. Derived metric calculation for business performance indicators
+    5. Numeric dtype downcasting (integer quantities, float32 ratios)
     
     BUSINESS METRICS CALCULATED:
     - Gross Profit: Revenue minus cost of goods sold (indicates basic profitability)
@@ -214,7 +469,7 @@ def clean_data(df: pd.DataFrame) -> pd.DataFrame:
     - Stock Turnover: Inventory efficiency ratio (assesses inventory management)  
     - Sales-to-Purchase Ratio: Sales performance indicator (evaluates sales effectiveness)
     """
-    logging.info("Cleaning data and calculating performance metrics…")
+    logging.info("Cleaning data and calculating performance metrics...")
 
     # Convert volume to numeric type for calculations
     if "volume" in df.columns:
@@ -232,45 +487,55 @@ def clean_data(df: pd.DataFrame) -> pd.DataFrame:
         df["description"] = df["description"].astype(str).str.strip()
 
     # ==================== FEATURE ENGINEERING ====================
-    
-    # Gross Profit: Total sales revenue minus total purchase cost
-    # Fundamental measure of business profitability
-    df["gross_profit"] = df["total_sales_dollars"] - df["total_purchase_dollars"]
-
-    # Profit Margin: Gross profit as percentage of sales revenue
-    # Division by zero protection for records with no sales
-    # Key metric for comparing vendor profitability efficiency
-    df["profit_margin"] = (
-        (df["gross_profit"] / df["total_sales_dollars"]) * 100
-    ).where(df["total_sales_dollars"] != 0, 0)
-
-    # Stock Turnover: Sales quantity relative to purchase quantity
-    # Measures inventory management efficiency
-    # High turnover indicates good inventory management
-    df["stock_turnover"] = (
-        df["total_sales_quantity"] / df["total_purchase_quantity"]
-    ).where(df["total_purchase_quantity"] != 0, 0)
+    # Fused compiled kernel for large frames when numba is available, NumPy otherwise
+    if numba is not None and len(df) >= NUMBA_MIN_ROWS:
+        _derive_metrics_numba(df)
+    else:
+        _derive_metrics_numpy(df)
 
-    # Sales-to-Purchase Ratio: Sales dollars relative to purchase dollars
-    # Indicates sales performance and pricing strategy
-    # Values > 1 indicate profitable sales operations
-    df["sales_to_purchase_ratio"] = (
-        df["total_sales_dollars"] / df["total_purchase_dollars"]
-    ).where(df["total_purchase_dollars"] != 0, 0)
+    # Narrow dtypes: smaller frame in memory and fewer bytes written by to_sql
+    _downcast_numeric(df)
 
     logging.info("Data cleaning and feature engineering complete.")
     return df
 
 
+def build_summary_table(engine, table_name: str = "summary_table"):
+    """
+    Materialize the cleaned vendor summary directly inside PostgreSQL.
+    
+    PERFORMANCE NOTE:
+    CREATE TABLE AS runs the whole query server-side, so the summary never crosses
+    the wire - no fetch into pandas and no write back with to_sql. The drop and
+    create run in one transaction, so readers never see a missing table.
+    
+    The table is rebuilt in full on every run rather than refreshed incrementally:
+    ingestion replaces the raw tables wholesale and the source CSVs carry no
+    last-updated column, so there is no delta to apply.
+    
+    RETURNS:
+        int: Number of rows written to the summary table
+    """
+    logging.info(f"Building {table_name} server-side with CREATE TABLE AS...")
+    with engine.begin() as cx:
+        cx.execute(text(f"DROP TABLE IF EXISTS {table_name}"))
+        result = cx.execute(text(f"CREATE TABLE {table_name} AS {VENDOR_SUMMARY_SQL_WITH_METRICS}"))
+    logging.info(f"[OK] Wrote {result.rowcount:,} rows to '{table_name}' (replace)")
+    return result.rowcount
+
+
 def main():
     """
     Main execution function for vendor summary pipeline.
     
     WORKFLOW:
     1. EXTRACT: Query data from database using comprehensive SQL joins and aggregations
-    2. TRANSFORM: Clean data and calculate business performance metrics
+    2. TRANSFORM: Clean data and calculate business performance metrics (in the same SQL query)
     3. LOAD: Store pre-aggregated results back to database for fast access
     
+    All three steps run inside PostgreSQL via CREATE TABLE AS; only a 5-row
+    sample is fetched for logging.
+    
     PERFORMANCE BENEFITS:
     • Avoids repeated expensive joins and aggregations during analysis
     • Enables fast dashboard queries by using pre-computed summary data
@@ -278,29 +543,19 @@ def main():
     """
     logging.info("===== Building Vendor Summary Table (Performance Optimized) =====")
     try:
-        # Step 1: EXTRACT - Build summary from live database
-        # This is the computationally expensive step that we pre-compute
-        summary_df = create_vendor_summary(engine)
-        logging.info(f"Raw summary sample:\n{summary_df.head(5)}")
-
-        # Step 2: TRANSFORM - Clean data and derive business metrics
-        # Adds calculated fields for comprehensive performance analysis
-        clean_df = clean_data(summary_df)
-        logging.info(f"Cleaned summary sample:\n{clean_df.head(5)}")
-
-        # Step 3: LOAD - Write cleaned summary to database
-        # Creates optimized dataset for fast reporting and dashboarding
-        logging.info("Writing pre-aggregated vendor summary to table: summary_table …")
-        ingest_db(clean_df, "summary_table", engine)
+        # Step 1-3: EXTRACT + TRANSFORM + LOAD - Build summary table server-side
+        # Joins, aggregations, cleaning and derived metrics all run in one SQL statement
+        build_summary_table(engine, "summary_table")
+
+        # Small sample read purely for logging
+        sample_df = pd.read_sql_query(text("SELECT * FROM summary_table LIMIT 5"), con=engine)
+        logging.info(f"Cleaned summary sample:\n{sample_df}")
         
-        logging.info("✅ Vendor summary table generation completed successfully.")
-        logging.info("🎯 Performance benefit: Future analyses can query summary_table instead of raw tables")
-        print("✅ Vendor summary table created successfully!")
-        print("📊 Performance optimized: Pre-aggregated data ready for fast dashboard queries")
+        logging.info("[OK] Vendor summary table generation completed successfully.")
+        logging.info("Performance benefit: Future analyses can query summary_table instead of raw tables")
         
     except Exception as e:
-        logging.exception(f"❌ Pipeline failed: {e}")
-        print(f"❌ Error: {e}")
+        logging.exception(f"[ERR] Pipeline failed: {e}")
         raise
 
 
@@ -17,8 +17,9 @@ DATA SOURCES:
 - Includes purchases, sales, pricing, inventory, and invoice data
 
 TECHNICAL STACK:
-- PostgreSQL 13+ with psycopg2 adapter
-- Pandas for data processing and chunked loading
+- PostgreSQL 13+ with psycopg2 adapter (COPY FROM STDIN bulk loading)
+- PyArrow multi-threaded CSV reader for chunked loading
+- Pandas for table schema creation
 - SQLAlchemy for database engine management
 - Python logging for production-grade monitoring
 
@@ -28,11 +29,16 @@ BUSINESS VALUE:
 - Provides foundation for Tableau dashboards and reporting
 """
 
+import io
 import os
+import csv
 import time
 import logging
+import logging.handlers
+import concurrent.futures
 import pandas as pd
-from sqlalchemy import create_engine
+import pyarrow.csv as pa_csv
+from sqlalchemy import create_engine, text
 
 # ==================== CONFIGURATION ====================
 # Database configuration - REPLACE WITH YOUR CREDENTIALS
@@ -47,29 +53,153 @@ DATA_DIR = "data"         # Source directory containing CSV files
 LOG_DIR = "logs"          # Log directory for ingestion monitoring
 
 # Performance tuning parameters
-CHUNK_SIZE = 200_000      
-WRITE_METHOD = "multi"     # Batch insert method for optimal performance
+BLOCK_SIZE = 64 << 20     # Default bytes of CSV parsed per record batch (64 MB)
+MIN_BLOCK_SIZE = 4 << 20   # Adaptive block size bounds, scaled by file size
+MAX_BLOCK_SIZE = 256 << 20
+WRITE_METHOD = "copy_file" # "copy_file": stream raw CSV bytes into COPY (no client-side parsing)
+                           # "copy": parse with PyArrow, COPY each record batch
+                           # "insert": batched multi-row INSERTs (when COPY is unavailable)
+MAX_WORKERS = 4            # Parallel file loads - keep well below PostgreSQL max_connections
+
+# Explicit column types for known tables, keyed by normalized table/column name
+# Narrow integers and fixed-point money instead of inferred BIGINT/DOUBLE/TEXT
+SCHEMAS = {
+    "purchases": {
+        "inventoryid": "TEXT", "store": "SMALLINT", "brand": "INTEGER", "description": "TEXT",
+        "size": "TEXT", "vendornumber": "INTEGER", "vendorname": "TEXT", "ponumber": "INTEGER",
+        "podate": "DATE", "receivingdate": "DATE", "invoicedate": "DATE", "paydate": "DATE",
+        "purchaseprice": "NUMERIC(12,2)", "quantity": "INTEGER", "dollars": "NUMERIC(12,2)",
+        "classification": "SMALLINT",
+    },
+    "purchase_prices": {
+        "brand": "INTEGER", "description": "TEXT", "price": "NUMERIC(12,2)", "size": "TEXT",
+        "volume": "TEXT", "classification": "SMALLINT", "purchaseprice": "NUMERIC(12,2)",
+        "vendornumber": "INTEGER", "vendorname": "TEXT",
+    },
+    "vendor_invoice": {
+        "vendornumber": "INTEGER", "vendorname": "TEXT", "invoicedate": "DATE", "ponumber": "INTEGER",
+        "podate": "DATE", "paydate": "DATE", "quantity": "INTEGER", "dollars": "NUMERIC(12,2)",
+        "freight": "NUMERIC(12,2)", "approval": "TEXT",
+    },
+    "sales": {
+        "inventoryid": "TEXT", "store": "SMALLINT", "brand": "INTEGER", "description": "TEXT",
+        "size": "TEXT", "salesquantity": "INTEGER", "salesdollars": "NUMERIC(12,2)",
+        "salesprice": "NUMERIC(12,2)", "salesdate": "DATE", "volume": "TEXT",
+        "classification": "SMALLINT", "excisetax": "NUMERIC(12,2)", "vendorno": "INTEGER",
+        "vendorname": "TEXT",
+    },
+    "begin_inventory": {
+        "inventoryid": "TEXT", "store": "SMALLINT", "city": "TEXT", "brand": "INTEGER",
+        "description": "TEXT", "size": "TEXT", "onhand": "INTEGER", "price": "NUMERIC(12,2)",
+        "startdate": "DATE",
+    },
+    "end_inventory": {
+        "inventoryid": "TEXT", "store": "SMALLINT", "city": "TEXT", "brand": "INTEGER",
+        "description": "TEXT", "size": "TEXT", "onhand": "INTEGER", "price": "NUMERIC(12,2)",
+        "enddate": "DATE",
+    },
+}
+
+# Text columns whose CSVs spell missing values as pandas NA tokens (e.g. 'None').
+# Every write method loads those tokens as text, so they are reset to NULL after the load,
+# as pandas read_csv stored them
+NA_TOKEN_COLUMNS = {
+    "vendor_invoice": ("approval",),
+}
+PANDAS_NA_TOKENS = [
+    "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan", "1.#IND", "1.#QNAN",
+    "<NA>", "N/A", "NA", "NULL", "NaN", "None", "n/a", "nan", "null",
+]
+
+# Post-load indexes on the join/group keys used by get_vendor_summary.py
+TABLE_INDEXES = {
+    "purchases": [
+        "CREATE INDEX IF NOT EXISTS ix_purchases_vn_brand ON purchases (vendornumber, brand)",
+    ],
+    "sales": [
+        "CREATE INDEX IF NOT EXISTS ix_sales_vn_brand ON sales (vendorno, brand)",
+    ],
+    "vendor_invoice": [
+        "CREATE INDEX IF NOT EXISTS ix_vendor_invoice_vn ON vendor_invoice (vendornumber)",
+    ],
+    "purchase_prices": [
+        "CREATE INDEX IF NOT EXISTS ix_purchase_prices_brand ON purchase_prices (brand)",
+    ],
+}
+
+# Aggregation-heavy tables converted to columnar storage after load, when the
+# server provides the "columnar" table access method (citus_columnar, PostgreSQL 15+)
+COLUMNAR_TABLES = ("sales", "purchases")
 
 # ==================== LOGGING SETUP ====================
 # Create logs directory if it doesn't exist
 os.makedirs(LOG_DIR, exist_ok=True)
 
 # Configure comprehensive logging for production monitoring
+# One logger call feeds both the log file and the console (no separate print)
+_file_handler = logging.FileHandler(
+    os.path.join(LOG_DIR, "ingestion_db.log"),
+    mode="a",  # Append mode to preserve historical logs
+    encoding="utf-8",
+)
+_file_handler.setFormatter(logging.Formatter("%(asctime)s - %(levelname)s - %(message)s"))
+_console_handler = logging.StreamHandler()
+_console_handler.setLevel(logging.INFO)
+_console_handler.setFormatter(logging.Formatter("%(message)s"))
 logging.basicConfig(
-    filename=os.path.join(LOG_DIR, "ingestion_db.log"),
     level=logging.DEBUG,  # Capture all levels for debugging
-    format="%(asctime)s - %(levelname)s - %(message)s",
-    filemode="a",  # Append mode to preserve historical logs
+    handlers=[
+        # Buffer file writes; flushed every 1024 records, on errors and at shutdown
+        logging.handlers.MemoryHandler(capacity=1024, flushLevel=logging.ERROR, target=_file_handler),
+        _console_handler,
+    ],
 )
 
+def _flush_logs():
+    """
+    Flush buffered log records to disk.
+    
+    Pool workers exit without running atexit hooks, and a forked worker would
+    re-emit records still buffered in the parent, so buffers are flushed at
+    both boundaries explicitly.
+    """
+    for handler in logging.getLogger().handlers:
+        handler.flush()
+
 # ==================== DATABASE ENGINE ====================
 # Create SQLAlchemy engine for efficient database operations
 # Using psycopg2 driver for PostgreSQL compatibility
+# INSERT executemany() uses SQLAlchemy's insertmanyvalues batching, so the "insert"
+# fallback sends one multi-row INSERT per 10k-row page instead of per-row statements
 engine = create_engine(
-    f"postgresql+psycopg2://{DB_USER}:{DB_PASS}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
+    f"postgresql+psycopg2://{DB_USER}:{DB_PASS}@{DB_HOST}:{DB_PORT}/{DB_NAME}",
+    executemany_mode="values_plus_batch",
+    insertmanyvalues_page_size=10_000,
+    executemany_batch_page_size=10_000,
 )
 
 # ==================== HELPER FUNCTIONS ====================
+# Translation table for identifier cleaning: every non-alphanumeric
+# character maps to "_" in a single C-level str.translate pass
+class _IdentifierTable(dict):
+    """Latin-1 is precomputed; any other code point is classified (and cached) on first use."""
+
+    def __missing__(self, code: int) -> str:
+        ch = chr(code)
+        self[code] = ch if ch.isalnum() else "_"
+        return self[code]
+
+_TRANS = _IdentifierTable((i, "_") for i in range(256) if not chr(i).isalnum())
+
+def _normalize_identifier(name: str) -> str:
+    """
+    Lowercase a name and replace non-alphanumeric characters with underscores.
+    
+    EXAMPLE:
+    'Vendor Number' → 'vendor_number'
+    """
+    return str(name).lower().translate(_TRANS)
+
 def _safe_table_name(name: str) -> str:
     """
     Convert filename to SQL-safe table name.
@@ -90,64 +220,252 @@ def _safe_table_name(name: str) -> str:
     """
     # Remove file extension and clean special characters
     base = os.path.splitext(name)[0]
-    return "".join(ch.lower() if ch.isalnum() else "_" for ch in base)
+    return _normalize_identifier(base)
+
+def _copy_batch(cur, batch, table_name: str, columns: list):
+    """
+    Bulk load one Arrow record batch with PostgreSQL COPY FROM STDIN.
+    
+    PERFORMANCE NOTE:
+    - Arrow's C++ CSV writer serializes the batch without Python row objects
+    - COPY streams rows in CSV form, so the server never parses per-row INSERT SQL
+    - Nulls are written as unquoted empty fields, which COPY loads as NULL;
+      non-null strings are always quoted, so a quoted "" stays an empty string
+    """
+    buf = io.BytesIO()
+    pa_csv.write_csv(batch, buf, write_options=pa_csv.WriteOptions(include_header=False))
+    buf.seek(0)
+
+    cols = ", ".join(f'"{col}"' for col in columns)
+    cur.copy_expert(f'COPY "{table_name}" ({cols}) FROM STDIN WITH (FORMAT CSV)', buf)
+
+def _copy_file(cur, file_path: str, table_name: str, columns: list) -> int:
+    """
+    Stream a CSV file's bytes straight into PostgreSQL with COPY FROM STDIN.
+    
+    PERFORMANCE NOTE:
+    - The header line is skipped and replaced by the normalized column list
+    - Row data is never parsed client-side; PostgreSQL does all type conversion
+    - COPY reads the file incrementally, so memory stays bounded without chunking
+    - Only unquoted empty fields load as NULL; tokens such as NA, NULL or None
+      are kept as literal text (see _null_na_tokens for the affected columns)
+    
+    RETURNS:
+    int: Number of rows loaded
+    """
+    cols = ", ".join(f'"{col}"' for col in columns)
+    with open(file_path, "rb") as f:
+        f.readline()  # Skip original header
+        cur.copy_expert(f'COPY "{table_name}" ({cols}) FROM STDIN WITH (FORMAT CSV, HEADER false)', f)
+    return cur.rowcount
+
+def _null_na_tokens(cx, table_name: str):
+    """
+    Set the NA_TOKEN_COLUMNS of a freshly loaded table to NULL where they hold
+    a pandas NA token, matching what the original read_csv-based load stored.
+    """
+    for col in NA_TOKEN_COLUMNS.get(table_name, ()):
+        cx.execute(
+            text(f'UPDATE "{table_name}" SET "{col}" = NULL WHERE "{col}" = ANY(:tokens)'),
+            {"tokens": PANDAS_NA_TOKENS},
+        )
+
+def _block_size_for(file_size: int) -> int:
+    """
+    Pick a PyArrow block size from the file size.
+    
+    Small files get small blocks (no oversized buffers for a few rows); large
+    files get large blocks so each batch saturates COPY and schema inference
+    samples more rows. Clamped to [MIN_BLOCK_SIZE, MAX_BLOCK_SIZE].
+    """
+    return max(MIN_BLOCK_SIZE, min(MAX_BLOCK_SIZE, file_size // 8))
 
-def ingest_csv_chunked(file_path: str, table_name: str):
+def ingest_csv_chunked(file_path: str, table_name: str, block_size: int = BLOCK_SIZE):
     """
     Stream large CSV files into PostgreSQL using chunked processing.
     
     MEMORY MANAGEMENT STRATEGY:
-    - Processes data in configurable chunks to avoid RAM overload
-    - First chunk creates table with 'replace' mode
-    - Subsequent chunks append data for incremental loading
+    - Parses data in fixed-size byte blocks to avoid RAM overload
+    - Creates an empty table from SCHEMAS (or the schema inferred on the first block)
+    - Table creation and every load step share a single transaction
+    - "copy_file": file bytes are streamed straight into COPY FROM STDIN
+    - "copy": every record batch is bulk loaded with COPY FROM STDIN
+    - "insert": every record batch is appended with batched INSERTs
     
     ERROR HANDLING:
     - Comprehensive exception handling with detailed logging
     - Continues processing other files if one fails
+    - A failed load rolls back as a whole (no half-populated tables)
     - Provides clear error messages for troubleshooting
     
     PERFORMANCE OPTIMIZATIONS:
-    - Uses pandas read_csv with low_memory=True for efficiency
-    - Implements batch inserts via 'multi' method
+    - Uses PyArrow's multi-threaded CSV reader instead of pandas read_csv
+    - Loads rows via COPY instead of multi-row INSERT statements
+    - Skips client-side parsing entirely when only the header needs normalizing
     - Cleans column names for SQL compatibility
     
     PARAMETERS:
     file_path: Full path to source CSV file
     table_name: Target table name in PostgreSQL
+    block_size: Bytes of CSV parsed per record batch
+    
+    RETURNS:
+    bool: True if the file was loaded, False if ingestion failed
     """
     try:
-        first = True    # Flag for table creation vs. appending
         rows_total = 0  # Track total rows processed
 
-        # Stream CSV file in chunks to manage memory usage
-        for chunk in pd.read_csv(file_path, chunksize=CHUNK_SIZE, low_memory=True):
-            # Clean column names for SQL compatibility
-            # Convert to lowercase and replace special characters with underscores
-            chunk.columns = ["".join(c.lower() if c.isalnum() else "_" for c in str(col)) for col in chunk.columns]
-
-            # Determine write strategy: replace for first chunk, append for others
-            if_exists = "replace" if first else "append"
-
-            # Write chunk to database with optimized batch insert
-            chunk.to_sql(
-                table_name,
-                con=engine,
-                if_exists=if_exists,
-                index=False,  # Exclude pandas index column
-                method=WRITE_METHOD,  # Use batch insert for performance
+        # Read only the header line - no block is parsed or type-inferred for it
+        with open(file_path, newline="", encoding="utf-8-sig") as f:
+            header = next(csv.reader(f))
+
+        # Clean column names once per file for SQL compatibility
+        # Convert to lowercase and replace special characters with underscores
+        columns = [_normalize_identifier(col) for col in header]
+
+        # Use the explicit DDL when every CSV column is covered by it,
+        # otherwise fall back to the types PyArrow inferred on the first block
+        schema = SCHEMAS.get(table_name)
+        if schema is not None and not set(columns) <= set(schema):
+            logging.warning(f"Header of {os.path.basename(file_path)} does not match SCHEMAS['{table_name}'] - inferring types")
+            schema = None
+
+        # Stream CSV file in record batches to manage memory usage
+        # Only needed when rows are parsed client-side or types must be inferred
+        reader = None
+        if WRITE_METHOD in ("copy", "insert") or schema is None:
+            # Only empty fields count as null (string columns included), matching
+            # how COPY loads an unquoted empty field
+            reader = pa_csv.open_csv(
+                file_path,
+                read_options=pa_csv.ReadOptions(block_size=block_size, use_threads=True),
+                convert_options=pa_csv.ConvertOptions(null_values=[""], strings_can_be_null=True),
             )
-            
-            rows_total += len(chunk)
-            first = False   # Switch to append mode after first chunk
+
+        # One transaction per file: table replace + load commit together, so WAL is
+        # flushed once and a failed load leaves the previous table untouched
+        # With wal_level=minimal, COPY into a table created in the same transaction
+        # skips WAL entirely, without the crash-truncation risk of UNLOGGED tables
+        # Table names are double-quoted like to_sql does, so names such as
+        # '2017purchasepricesdec' or reserved words stay valid SQL
+        with engine.begin() as cx:
+            if schema is not None:
+                ddl = ", ".join(f'"{col}" {sql_type}' for col, sql_type in schema.items())
+                cx.execute(text(f'DROP TABLE IF EXISTS "{table_name}"'))
+                cx.execute(text(f'CREATE TABLE "{table_name}" ({ddl})'))
+            else:
+                empty = reader.schema.empty_table().to_pandas()
+                empty.columns = columns
+                empty.to_sql(
+                    table_name,
+                    con=cx,
+                    if_exists="replace",
+                    index=False,  # Exclude pandas index column
+                )
+
+            # DBAPI (psycopg2) cursor on the same connection for COPY support
+            cur = cx.connection.cursor()
+
+            if WRITE_METHOD == "copy_file":
+                # Pipe raw file bytes through COPY - zero Python work per row
+                rows_total = _copy_file(cur, file_path, table_name, columns)
+            elif WRITE_METHOD == "copy":
+                for batch in reader:
+                    # Bulk load batch rows via COPY FROM STDIN
+                    _copy_batch(cur, batch, table_name, columns)
+                    rows_total += batch.num_rows
+            else:
+                for batch in reader:
+                    # Fallback when COPY cannot be used: executemany → 10k-row INSERT pages
+                    chunk = batch.to_pandas()
+                    chunk.columns = columns
+                    chunk.to_sql(table_name, con=cx, if_exists="append", index=False)
+                    rows_total += batch.num_rows
+
+            # Same transaction: readers never see the literal NA tokens
+            _null_na_tokens(cx, table_name)
 
         # Log successful ingestion with summary statistics
-        logging.info(f"✅ Ingested {rows_total} rows into '{table_name}' from {os.path.basename(file_path)}")
-        print(f"✅ {os.path.basename(file_path)} → {table_name} ({rows_total} rows)")
+        logging.info(f"[OK] Ingested {rows_total} rows into '{table_name}' from {os.path.basename(file_path)}")
+        return True
         
     except Exception as e:
         # Comprehensive error handling with detailed logging
-        logging.error(f"❌ Failed ingest for {file_path} → {table_name}: {e}")
-        print(f"❌ Error: {file_path} → {table_name}: {e}")
+        # engine.begin() has already rolled the transaction back
+        logging.error(f"[ERR] Failed ingest for {file_path} -> {table_name}: {e}")
+        return False
+
+def _columnar_available(cx) -> bool:
+    """
+    Check whether the server can store tables with the "columnar" access method.
+    
+    ALTER TABLE ... SET ACCESS METHOD needs PostgreSQL 15+, and the access
+    method itself comes from the citus_columnar extension.
+    """
+    return bool(cx.execute(text(
+        "SELECT current_setting('server_version_num')::int >= 150000 "
+        "AND EXISTS (SELECT 1 FROM pg_am WHERE amname = 'columnar')"
+    )).scalar())
+
+def _finalize_table(table_name: str):
+    """
+    Prepare a freshly loaded table for the vendor summary query.
+    
+    - Converts COLUMNAR_TABLES to columnar storage when available, so the summary
+      aggregations read only the columns they need
+    - Creates the join/group-by indexes listed in TABLE_INDEXES
+    - Runs ANALYZE so the planner has statistics for the bulk-loaded rows
+    
+    Plain CREATE INDEX is used rather than CONCURRENTLY: the table was just
+    replaced and has no readers yet, and a concurrent build scans it twice.
+    """
+    try:
+        with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as cx:
+            if table_name in COLUMNAR_TABLES:
+                if _columnar_available(cx):
+                    cx.execute(text(f'ALTER TABLE "{table_name}" SET ACCESS METHOD columnar'))
+                    logging.info(f"Converted '{table_name}' to columnar storage")
+                else:
+                    logging.info(f"Columnar access method unavailable - keeping '{table_name}' as heap")
+            for ddl in TABLE_INDEXES.get(table_name, []):
+                cx.execute(text(ddl))
+            cx.execute(text(f'ANALYZE "{table_name}"'))
+        logging.info(f"Indexed and analyzed '{table_name}'")
+    except Exception as e:
+        logging.error(f"[ERR] Failed to finalize '{table_name}': {e}")
+
+def _init_worker():
+    """
+    Process pool initializer.
+    
+    A forked worker inherits the parent's engine, including any pooled
+    psycopg2 connections. Those sockets must not be shared across processes,
+    so the worker drops its copy of the pool (without closing the parent's
+    connections) and opens fresh connections on first use.
+    """
+    engine.dispose(close=False)
+
+def _ingest_one(entry: tuple):
+    """
+    Ingest a single CSV file from DATA_DIR into its own table.
+    
+    Runs inside a pool worker; each file targets a distinct table,
+    so files can be loaded independently and in parallel.
+    
+    PARAMETERS:
+    entry: (file name, file size in bytes) as discovered by load_raw_data
+    """
+    file, size = entry
+    file_path = os.path.join(DATA_DIR, file)
+    table_name = _safe_table_name(file)
+
+    # Log ingestion start with file details
+    logging.info(f"Ingesting {file} ({size / 1e6:,.1f} MB) -> table '{table_name}' (chunked)")
+    try:
+        if ingest_csv_chunked(file_path, table_name, block_size=_block_size_for(size)):
+            _finalize_table(table_name)
+    finally:
+        _flush_logs()
 
 def load_raw_data():
     """
@@ -155,44 +473,46 @@ def load_raw_data():
     
     WORKFLOW:
     1. Validates data directory existence
-    2. Discovers all CSV files in data directory
-    3. Processes each file through chunked ingestion
+    2. Discovers all CSV files in data directory, largest first
+    3. Processes files in parallel through chunked ingestion (one table per worker)
     4. Provides performance timing and completion summary
     
     ERROR PREVENTION:
     - Validates directory structure before processing
     - Handles missing files gracefully
-    - Provides clear user feedback throughout process
+    - Provides clear user feedback throughout process (console + log file)
     """
     start = time.time()   # Start timing for performance monitoring
 
     # Validate data directory exists
     if not os.path.isdir(DATA_DIR):
-        logging.error(f"Data folder not found: {DATA_DIR}")
-        print(f"❌ Data folder not found: {DATA_DIR}")
+        logging.error(f"[ERR] Data folder not found: {DATA_DIR}")
         return
 
-    # Discover all CSV files in data directory
-    files = [f for f in os.listdir(DATA_DIR) if f.lower().endswith(".csv")]
+    # Discover all CSV files in data directory with their sizes
+    # scandir lists and sizes files in one pass (file type comes from the dir entry)
+    with os.scandir(DATA_DIR) as it:
+        files = [(e.name, e.stat().st_size) for e in it if e.is_file() and e.name.lower().endswith(".csv")]
     if not files:
-        logging.warning("No CSV files found in 'data/'")
-        print("⚠️ No CSVs in data/")
+        logging.warning("[WARN] No CSV files found in 'data/'")
         return
 
-    # Process each CSV file through ingestion pipeline
-    for file in files:
-        file_path = os.path.join(DATA_DIR, file)
-        table_name = _safe_table_name(file)
+    # Largest files first (longest-processing-time-first scheduling): big tables
+    # start immediately and small ones fill in, minimizing total wall time
+    files.sort(key=lambda entry: entry[1], reverse=True)
+
+    _flush_logs()  # Empty the buffer before workers fork
 
-        # Log ingestion start with file details
-        logging.info(f"📥 Ingesting {file} → table '{table_name}' (chunked)")
-        ingest_csv_chunked(file_path, table_name)
+    # Process CSV files in parallel - each file loads into a distinct table
+    # Pool size is capped by MAX_WORKERS so PostgreSQL backends are not exhausted
+    workers = min(len(files), os.cpu_count() or 1, MAX_WORKERS)
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as ex:
+        list(ex.map(_ingest_one, files))
 
     # Calculate and log total processing time
     mins = (time.time() - start) / 60
     logging.info("-- Ingestion Complete --")
-    logging.info(f"Total Time Taken: {mins:.2f} minutes")
-    print(f"🎉 Done in {mins:.2f} minutes")
+    logging.info(f"[OK] Total Time Taken: {mins:.2f} minutes")
 
 # ==================== MAIN EXECUTION ====================
 if __name__ == "__main__":